@@ -1,15 +1,27 @@
 from __future__ import annotations
-from contextlib import suppress
-from copy import copy
+import asyncio
+from dataclasses import replace
+from functools import partial
 from pathlib import Path
-from typing import Type, Union
-from rich.style import Style, NULL_STYLE
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Tuple,
+    Type,
+    Union,
+)
 
 from textual import events
 from textual.app import App
+from textual.binding import Binding, Bindings
 from textual.widgets import Header, TreeControl, TreeClick
 from textual.widget import Widget
-from textual import actions
 
 from dlmanage.slurmbridge.cliobject import SlurmObjectException
 from dlmanage.slurmbridge.objects import Account, Association, Job, User, Node
@@ -17,38 +29,38 @@ from dlmanage.slurmbridge.scontrol import SlurmControlError
 from dlmanage.slurmbridge.sacctmgr import SlurmAccountManagerError
 
 
-from dlmanage.widgets import Footer, TableTheme, LogView, JumpableScrollView
+from dlmanage.widgets import Footer, LogView, JumpableScrollView
 
 from dlmanage.models import AssociationListModel, JobListModel, NodeListModel
+from dlmanage.theme import AppTheme, THEME
 from dlmanage.widgets.footer import ErrorDismissed, PromptResponse
 from dlmanage.widgets.interactive_table import InteractiveTableController, TablePosition
 
 
-class AppTheme(TableTheme):
-    # main colors: #007AD0, #729900, #CD652A
+# resolve the border styles once so focus changes only need to assign them
+_BLURRED = THEME.blurred_border_style
+_FOCUSED = THEME.header
+# fallback for actions that are triggered without a selection in the table
+_DEFAULT_POSITION = TablePosition("", 0)
 
-    cell = Style(color="bright_white")
-    header = Style(color="#CD652A")
-    text_cell = Style(color="#007AD0")
-    int_cell = Style(color="#729900")
-    hovered_cell = Style(bold=True, underline=True)
-    selected_row = Style(bgcolor="gray19")
-    choice_cell = Style(color="#007AD0")
-    focused_cell = Style(
-        color="#729900", bgcolor="gray30", bold=True, underline=True, overline=True
-    )
-    editing_cell = Style(color="green", bgcolor="gray30", bold=True, underline=False)
-    focused_border_style = NULL_STYLE
-    blurred_border_style = Style(color="gray62")
+# called with the response text and whether the prompt was confirmed
+ResponseAction = Callable[[str, bool], Awaitable[Any]]
 
 
 class SlurmControl(App):
-    theme = AppTheme()
+    theme = THEME
     controller: InteractiveTableController | None = None
     footer: Footer
-    current_response_action: str | None = None
+    current_response_action: ResponseAction | None = None
+    _binding_stack: List[Dict[str, Binding]]
+    _controllers: Dict[Type[InteractiveTableController], InteractiveTableController]
+    _controller_bindings: Dict[Type[InteractiveTableController], Dict[str, Binding]]
+    _switch_task: asyncio.Task[None] | None = None
 
     async def on_load(self, event: events.Load) -> None:
+        self._binding_stack = []
+        self._controllers = {}
+        self._controller_bindings = {}
         await self.bind("q", "quit", "Quit")
         await self.bind("ctrl+i", "switch_focus", "Switch Focus", show=False)
 
@@ -66,15 +78,9 @@ class SlurmControl(App):
         self.sidebar_content.border = "round"
         self.sidebar_content.can_focus = True
 
-        await self.sidebar_content.root.add(
-            JobTableController.model_class.title, JobTableController
-        )
-        await self.sidebar_content.root.add(
-            AssociationTableController.model_class.title, AssociationTableController
-        )
-        await self.sidebar_content.root.add(
-            NodeTableController.model_class.title, NodeTableController
-        )
+        # the tree only ever holds controller classes, so clicks don't need to check them
+        for title, controller_class in _SIDEBAR_ENTRIES:
+            await self.sidebar_content.root.add(title, controller_class)
         await self.sidebar_content.root.expand()
 
         await self.view.dock(self.header, edge="top")
@@ -84,17 +90,23 @@ class SlurmControl(App):
 
         # initially set the focus to the sidebar so we can steal it after loading the model
         await self.set_focus(self.sidebar_content)
-        await self.switch_controller(JobTableController(self))
+        # load the first model in the background so the ui shows up without waiting for slurm
+        self.open_controller_in_background(JobTableController)
 
     async def set_focus(self, widget: Widget | None) -> None:
-        if self.focused == widget:
+        previous = self.focused
+        if previous is widget:
             return
 
-        if self.focused:
-            self.focused.border_style = AppTheme.blurred_border_style
         await super().set_focus(widget)
-        if self.focused:
-            self.focused.border_style = AppTheme.header
+        current = self.focused
+        # only restyle the widgets whose focus state actually changed
+        if current is previous:
+            return
+        if previous is not None:
+            previous.border_style = _BLURRED
+        if current is not None:
+            current.border_style = _FOCUSED
 
     async def action_switch_focus(self):
         if self.sidebar_content == self.focused:
@@ -102,50 +114,130 @@ class SlurmControl(App):
         else:
             await self.sidebar_content.focus()
 
+    @staticmethod
+    def _namespace_bindings(
+        bindings: Iterable[Binding], namespace: str
+    ) -> Dict[str, Binding]:
+        return {
+            binding.key: replace(binding, action=f"{namespace}.{binding.action}")
+            for binding in bindings
+        }
+
+    def _install_bindings(self, bindings: Iterable[Binding], namespace: str):
+        self.bindings.keys.update(self._namespace_bindings(bindings, namespace))
+
     async def bind_controller(self, controller: InteractiveTableController):
         self._action_targets.add("controller")
-        for binding in controller.keys.values():
-            await self.bind(
-                keys=binding.key,
-                action=f"controller.{binding.action}",
-                description=binding.description,
-                key_display=binding.key_display,
-            )
-        self.footer.refresh()
+        # controllers only bind keys in __init__, so their namespaced copies can be reused
+        controller_class = type(controller)
+        bindings = self._controller_bindings.get(controller_class)
+        if bindings is None:
+            bindings = self._namespace_bindings(controller.keys.values(), "controller")
+            self._controller_bindings[controller_class] = bindings
+        self.bindings.keys.update(bindings)
 
     async def unbind_controller(self, controller: InteractiveTableController):
-        for key in controller.keys.keys():
-            del self.bindings.keys[key]
-        self._action_targets.remove("controller")
+        if len(self._binding_stack) > 0:
+            # drop all layers the controller pushed on top of its own bindings
+            self.bindings.keys = self._binding_stack[0]
+            self._binding_stack.clear()
+        bindings = self.bindings.keys
+        for key in tuple(controller.keys):
+            bindings.pop(key, None)
+        self._action_targets.discard("controller")
+
+    async def push_bindings(self, bindings: Bindings):
+        # temporarily replace the bindings of the current controller
+        previous = self.bindings.keys
+        self._binding_stack.append(previous)
+        self.bindings.keys = {
+            key: binding
+            for key, binding in previous.items()
+            if not binding.action.startswith("controller.")
+        }
+        self._install_bindings(bindings.keys.values(), "controller")
+        self.footer.refresh()
+
+    async def pop_bindings(self):
+        self.bindings.keys = self._binding_stack.pop()
         self.footer.refresh()
 
     async def switch_controller(self, controller: InteractiveTableController) -> None:
         # unregister the bindings from the old model
         if self.controller is not None:
             self.controller.view.is_loading = True
-            await self.unbind_controller(self.controller)
-            await self.controller.uninitialize()
+            await asyncio.gather(
+                self.unbind_controller(self.controller),
+                self.controller.uninitialize(),
+            )
 
         self.controller = controller
         # register the new model bindings
         if controller is not None:
             self.header.sub_title = self.controller.model_class.title
-            await self.bind_controller(controller)
-            await self.controller.initialize()
+            # show the view right away and give it a frame before slurm is queried.
+            # a reopened controller shows its previous data instead of the spinner
+            self.controller.view.is_loading = not self.controller.view.cells
+            self.controller.view.can_focus = True
+            await self.main_content_container.update(self.controller.view)
+            await asyncio.sleep(0)
+            # binding is independent of the data, so overlap it with the first load
+            await asyncio.gather(
+                self.bind_controller(controller), self.controller.initialize()
+            )
+            # mount the view again so the layout is measured with the loaded data
             await self.main_content_container.update(self.controller.view)
             await self.set_focus(self.main_content_container.window.widget)
             self.controller.view.is_loading = False
-            self.footer.refresh()
+        # the footer shows the bindings of the new controller, redraw it once per switch
+        self.footer.refresh()
+
+    async def open_controller(
+        self, controller_class: Type[InteractiveTableController]
+    ) -> None:
+        # controllers are only constructed when they are first opened and then reused
+        controller = self._controllers.get(controller_class)
+        if controller is None:
+            controller = self._controllers[controller_class] = controller_class(self)
+        await self.switch_controller(controller)
+
+    def open_controller_in_background(
+        self, controller_class: Type[InteractiveTableController]
+    ) -> None:
+        # loading a model can take a while, don't block the message loop meanwhile
+        if self._switch_task is not None and not self._switch_task.done():
+            self._switch_task.cancel()
+        self._switch_task = asyncio.create_task(
+            self._open_controller_or_show_error(controller_class)
+        )
+
+    async def _open_controller_or_show_error(
+        self, controller_class: Type[InteractiveTableController]
+    ) -> None:
+        # nothing awaits the switch, so its errors have to be shown from here.
+        # a cancelled switch raises CancelledError, which is no Exception
+        try:
+            await self.open_controller(controller_class)
+        except Exception as error:
+            if self.controller is not None:
+                self.controller.view.is_loading = False
+            await self.display_error(error)
 
     async def handle_tree_click(self, message: TreeClick) -> None:
         if not self.sidebar_content.can_focus:
             return
         controller_class = message.node.data
-        if controller_class is not None and issubclass(
-            controller_class, InteractiveTableController
+        # ignore clicks while a switch is in progress or on the open model
+        if self._switch_task is not None and not self._switch_task.done():
+            return
+        # a model whose load failed can be clicked again to retry it
+        if (
+            type(self.controller) is controller_class
+            and self.controller.interval_timer is not None
         ):
-            controller = controller_class(self)
-            await self.switch_controller(controller)
+            return
+        if controller_class is not None:
+            self.open_controller_in_background(controller_class)
 
     async def focus_footer(self):
         await self.set_focus(self.footer)
@@ -158,12 +250,12 @@ class SlurmControl(App):
         self.controller.view.can_focus = True
         self.sidebar_content.can_focus = True
 
-    async def prompt(self, message: str, response_action: str):
+    async def prompt(self, message: str, response_action: ResponseAction):
         self.current_response_action = response_action
         await self.focus_footer()
         self.footer.prompt(message)
 
-    async def confirm(self, message: str, response_action: str):
+    async def confirm(self, message: str, response_action: ResponseAction):
         self.current_response_action = response_action
         await self.focus_footer()
         self.footer.confirm(message)
@@ -174,12 +266,9 @@ class SlurmControl(App):
 
         await self.blur_footer()
 
-        action_name, fixed_args = actions.parse(self.current_response_action)
-        response_args = (message.response, message.confirmed)
-        action_args = ", ".join([repr(arg) for arg in fixed_args + response_args])
-        action_to_fire = f"{action_name}({action_args})"
-        await self.action(action_to_fire)
+        response_action = self.current_response_action
         self.current_response_action = None
+        await response_action(message.response, message.confirmed)
 
     async def display_error(self, error: Exception | str):
         await self.focus_footer()
@@ -196,8 +285,10 @@ def main():
 class AssociationTableController(
     InteractiveTableController[Union[User, Account], SlurmControl]
 ):
+    __slots__ = ()
     model_class = AssociationListModel
     theme_class = AppTheme
+    model: AssociationListModel
 
     def __init__(self, app: SlurmControl):
         super().__init__(app)
@@ -206,46 +297,59 @@ class AssociationTableController(
         self.bind("ctrl+d", "delete_entry", "Delete Entry")
 
     async def action_add_account(self):
-        current_selection = self.view.selection_position or TablePosition("", 0)
+        current_selection = self.view.selection_position or _DEFAULT_POSITION
         await self.app.prompt(
             "Enter the new accountname",
-            f"controller.accountname_entered('{current_selection.column}', {current_selection.row})",
+            partial(
+                self.action_accountname_entered,
+                current_selection.column,
+                current_selection.row,
+            ),
         )
 
     async def action_accountname_entered(
         self, column: str, row: int, accountname: str, confirmed: bool
     ):
         if confirmed:
-            # try to find the next account up the hierarchy from the selected
-            # row "upwards"
-            parent: Association | None = self.model.get_data_object_for_row(row)
-            while not isinstance(parent, Account):
-                if parent is None:
-                    break
-                parent = parent.parent_object
+            # use the next account up the hierarchy from the selected row
+            selected: Association | None = self.model.get_data_object_for_row(row)
+            parent = selected.nearest_account if selected is not None else None
             parent_name = (
                 parent.account
                 if parent is not None and parent.account is not None
                 else "root"
             )
             try:
-                new_account = await Account.create(account=accountname)
-                with suppress(SlurmObjectException):
-                    await new_account.set_parent(parent_name)
+                await self._create_account(accountname, parent_name)
                 await self.refresh()
-                next_row = await self.model.get_next_row_matching(
-                    0, accountname, ("account",)
-                )
+                next_row = self.model.find_row("account", accountname)
                 if next_row is not None:
                     self.view.selection_position = TablePosition("", next_row)
             except (SlurmAccountManagerError, SlurmObjectException) as error:
                 await self.app.display_error(error)
 
+    @staticmethod
+    async def _create_account(accountname: str, parent_name: str) -> Account:
+        try:
+            # sacctmgr can place the account while creating it, which saves
+            # a separate modify and reload of the new account
+            return await Account.create(account=accountname, parent=parent_name)
+        except SlurmAccountManagerError:
+            if parent_name == "root":
+                raise
+            # a parent sacctmgr rejects must not keep the account from being
+            # created, it then stays at the default place
+            return await Account.create(account=accountname)
+
     async def action_add_user(self):
-        current_selection = self.view.selection_position or TablePosition("", 0)
+        current_selection = self.view.selection_position or _DEFAULT_POSITION
         await self.app.prompt(
             "Enter the new username",
-            f"controller.username_entered('{current_selection.column}', {current_selection.row})",
+            partial(
+                self.action_username_entered,
+                current_selection.column,
+                current_selection.row,
+            ),
         )
 
     async def action_username_entered(
@@ -253,15 +357,11 @@ class AssociationTableController(
     ):
         if confirmed:
             try:
-                # try to find the next account up the hierarchy from the selected
-                # row "upwards"
-                initial_account: Association | None = (
-                    self.model.get_data_object_for_row(row)
+                # use the next account up the hierarchy from the selected row
+                selected: Association | None = self.model.get_data_object_for_row(row)
+                initial_account = (
+                    selected.nearest_account if selected is not None else None
                 )
-                while not isinstance(initial_account, Account):
-                    if initial_account is None:
-                        break
-                    initial_account = initial_account.parent_object
                 initial_account_name = (
                     initial_account.account
                     if initial_account is not None
@@ -270,9 +370,7 @@ class AssociationTableController(
                 )
                 await User.create(user=username, account=initial_account_name)
                 await self.refresh()
-                next_row = await self.model.get_next_row_matching(
-                    0, username, ("user",)
-                )
+                next_row = self.model.find_row("user", username)
                 if next_row:
                     self.view.selection_position = TablePosition(column, next_row)
             except (SlurmAccountManagerError, SlurmObjectException) as error:
@@ -286,7 +384,11 @@ class AssociationTableController(
         object_to_delete = self.model.get_data_object_for_row(current_selection.row)
         await self.app.confirm(
             f"Do you really want to delete the {object_to_delete}",
-            f"controller.delete_confirmed('{current_selection.column}', {current_selection.row})",
+            partial(
+                self.action_delete_confirmed,
+                current_selection.column,
+                current_selection.row,
+            ),
         )
 
     async def action_delete_confirmed(
@@ -303,56 +405,94 @@ class AssociationTableController(
             except (SlurmAccountManagerError, SlurmObjectException) as error:
                 await self.app.display_error(error)
 
+    async def _update_account(
+        self, affected_object: User | Account, new_value: str
+    ) -> Tuple[str, str]:
+        new_account = await Account.get(account=new_value)
+        if isinstance(affected_object, User):
+            await affected_object.set_account(new_account)
+            return ("user", affected_object.user)
+        await affected_object.set_parent(new_account.account)
+        return ("account", affected_object.account)
+
+    async def _update_user(self, affected_object: User | Account, new_value: str):
+        assert isinstance(affected_object, User)
+        await affected_object.set_new_username(new_value)
+
+    async def _update_cpus(self, affected_object: User | Account, new_value: str):
+        affected_object.max_cpus = new_value
+        await self._save_association(affected_object)
+
+    async def _update_gpus(self, affected_object: User | Account, new_value: str):
+        affected_object.max_gpus = new_value
+        await self._save_association(affected_object)
+
+    async def _update_timelimit(
+        self, affected_object: User | Account, new_value: str | None
+    ):
+        if new_value is None:
+            new_value = "-1"
+        affected_object.grp_wall = new_value
+        await self._save_association(affected_object)
+
+    async def _save_association(self, association: User | Account):
+        # saving reloads the association on its own, which drops its links into the
+        # loaded tree. keep them so the row can be redrawn without a full reload
+        tree_links = {
+            name: getattr(association, name) for name in association._synthetic_fields
+        }
+        # if we update an account we can potentially update many associations
+        await association.save(allow_multiple_affected=isinstance(association, Account))
+        for name, value in tree_links.items():
+            setattr(association, name, value)
+
+    _COLUMN_HANDLERS: ClassVar[Dict[str, Callable[..., Awaitable[Any]]]] = {
+        "account": _update_account,
+        "user": _update_user,
+        "CPUs": _update_cpus,
+        "GPUs": _update_gpus,
+        "Timelimit": _update_timelimit,
+    }
+    # columns whose edits don't move the entry in the hierarchy
+    _IN_PLACE_COLUMNS: ClassVar[FrozenSet[str]] = frozenset(
+        ("CPUs", "GPUs", "Timelimit")
+    )
+
     async def on_cell_update(self, position: TablePosition, new_value: str) -> None:
-        affected_object = self.model.get_data_object_for_row(position.row)
+        handler = self._COLUMN_HANDLERS.get(position.column)
+        if handler is None:
+            raise AttributeError(f"Can't update column {position.column}")
 
-        # if we update an account we can potentially update many associations
-        allow_multiple_affected = (
-            True if isinstance(affected_object, Account) else False
-        )
         try:
-            match position.column:
-                case "account":
-                    new_account = await Account.get(account=new_value)
-                    next_row = None
-                    if isinstance(affected_object, User):
-                        await affected_object.set_account(new_account)
-                        await self.model.load_data()
-                        next_row = await self.model.get_next_row_matching(
-                            0, affected_object.user, ("user",)
-                        )
-                    else:
-                        await affected_object.set_parent(new_account.account)
-                        await self.model.load_data()
-                        next_row = await self.model.get_next_row_matching(
-                            0, affected_object.account, ("account",)
-                        )
-                    if next_row is not None:
-                        self.view.selection_position = TablePosition(
-                            "account", next_row
-                        )
-                case "user":
-                    assert isinstance(affected_object, User)
-                    await affected_object.set_new_username(new_value)
-                case "CPUs":
-                    affected_object.max_cpus = new_value
-                    await affected_object.save(allow_multiple_affected)
-                case "GPUs":
-                    affected_object.max_gpus = new_value
-                    await affected_object.save(allow_multiple_affected)
-                case "Timelimit":
-                    if new_value is None:
-                        new_value = "-1"
-                    affected_object.grp_wall = new_value
-                    await affected_object.save(allow_multiple_affected)
-                case unknown_name:
-                    raise AttributeError(f"Can't update column {unknown_name}")
-            await self.refresh()
+            # a reload that runs meanwhile could replace the rows with data from
+            # before the save, so hold the lock until the edit is shown
+            async with self._refresh_lock:
+                affected_object = self.model.get_data_object_for_row(position.row)
+                # handlers that move an entry in the hierarchy return where it went
+                moved_entry: Tuple[str, str] | None = await handler(
+                    self, affected_object, new_value
+                )
+                # the user was saved and reloaded in place, so only what is derived
+                # from it is outdated. saving an account can change several
+                # associations, those need a full reload
+                redraw_in_place = position.column in self._IN_PLACE_COLUMNS and (
+                    isinstance(affected_object, User)
+                )
+                if redraw_in_place:
+                    self.model.rebuild(tree_changed=False)
+                    await self.refresh_view()
+            if not redraw_in_place:
+                await self.refresh()
+            if moved_entry is not None:
+                next_row = self.model.find_row(*moved_entry)
+                if next_row is not None:
+                    self.view.selection_position = TablePosition("account", next_row)
         except (SlurmAccountManagerError, SlurmObjectException) as error:
             await self.app.display_error(error)
 
 
 class JobTableController(InteractiveTableController[Job, SlurmControl]):
+    __slots__ = ()
     model_class = JobListModel
     theme_class = AppTheme
 
@@ -380,7 +520,11 @@ class JobTableController(InteractiveTableController[Job, SlurmControl]):
         if needs_confirmation:
             return await self.app.confirm(
                 f'Do you really want to {action_name} the Job "{selected_job.job_name}" ({selected_job.job_id_with_array})',
-                f"controller.{action_name}_confirmed('{current_selection.column}', {current_selection.row})",
+                partial(
+                    getattr(self, f"action_{action_name}_confirmed"),
+                    current_selection.column,
+                    current_selection.row,
+                ),
             )
 
         try:
@@ -405,24 +549,33 @@ class JobTableController(InteractiveTableController[Job, SlurmControl]):
     async def action_close_log_view(self):
         self.view.can_focus = True
         await self.app.main_content_container.update(self.view)
-        await self.app.unbind_controller(self)
-        self.keys = self.old_binding
+        await self.app.pop_bindings()
         self.app.header.sub_title = self.model.title
-        await self.app.bind_controller(self)
+
+    async def _update_cpus(self, affected_object: Job, new_value: str):
+        await affected_object.set_cpus(new_value)
+
+    async def _update_gpus(self, affected_object: Job, new_value: str):
+        await affected_object.set_gpus(new_value)
+
+    async def _update_timelimit(self, affected_object: Job, new_value: str):
+        affected_object.time_limit = new_value
+        await affected_object.save()
+
+    _COLUMN_HANDLERS: ClassVar[Dict[str, Callable[..., Awaitable[Any]]]] = {
+        "CPUs": _update_cpus,
+        "GPUs": _update_gpus,
+        "Timelimit": _update_timelimit,
+    }
 
     async def on_cell_update(self, position: TablePosition, new_value: str) -> None:
         affected_object = self.model.get_data_object_for_row(position.row)
+        handler = self._COLUMN_HANDLERS.get(position.column)
+        if handler is None:
+            raise AttributeError(f"Don't know how to change {position.column}")
+
         try:
-            match (position.column):
-                case "CPUs":
-                    await affected_object.set_cpus(new_value)
-                case "GPUs":
-                    await affected_object.set_gpus(new_value)
-                case "Timelimit":
-                    affected_object.time_limit = new_value
-                    await affected_object.save()
-                case unknown_name:
-                    raise AttributeError(f"Don't know how to change {unknown_name}")
+            await handler(self, affected_object, new_value)
             await self.refresh()
         except (SlurmControlError, SlurmObjectException) as error:
             await self.app.display_error(error)
@@ -432,23 +585,24 @@ class JobTableController(InteractiveTableController[Job, SlurmControl]):
         if row_object.std_out is None:
             return await self.app.display_error(FileNotFoundError("File not found"))
         try:
-            log_view = LogView(Path(row_object.std_out))
+            log_view = await LogView.open(Path(row_object.std_out))
         except Exception as error:
             return await self.app.display_error(str(error))
 
         self.view.can_focus = False
-        await self.app.unbind_controller(self)
-        self.old_binding = copy(self.keys)
-        self.keys.clear()
-        self.bind("escape", "close_log_view()", "Return to Joblist", key_display="esc")
+        log_bindings = Bindings()
+        log_bindings.bind(
+            "escape", "close_log_view()", "Return to Joblist", key_display="esc"
+        )
+        await self.app.push_bindings(log_bindings)
         self.app.header.sub_title = (
             f"Logs for {row_object.job_name} (JobID: {row_object.job_id_with_array})"
         )
-        await self.app.bind_controller(self)
         await self.app.main_content_container.update(log_view)
 
 
 class NodeTableController(InteractiveTableController[Node, SlurmControl]):
+    __slots__ = ()
     model_class = NodeListModel
     theme_class = AppTheme
 
@@ -460,7 +614,7 @@ class NodeTableController(InteractiveTableController[Node, SlurmControl]):
     async def prompt_for_reason(self, target_node: str, target_state: str):
         await self.app.prompt(
             f"Specify a reason for the new {target_state} state",
-            f"controller.set_node_state('{target_node}', '{target_state}')",
+            partial(self.action_set_node_state, target_node, target_state),
         )
 
     async def action_prompt_reboot_reason_selected_node(self, force: bool):
@@ -474,7 +628,7 @@ class NodeTableController(InteractiveTableController[Node, SlurmControl]):
 
         return await self.app.prompt(
             f'Specify the Reboot reason for "{selected_node.node_name}"',
-            f"controller.reboot_node({current_selection.row}, {force})",
+            partial(self.action_reboot_node, current_selection.row, force),
         )
 
     async def action_reboot_node(
@@ -498,24 +652,38 @@ class NodeTableController(InteractiveTableController[Node, SlurmControl]):
             except (SlurmControlError, SlurmObjectException) as error:
                 await self.app.display_error(error)
 
+    async def _update_state(self, affected_object: Node, new_value: str) -> bool:
+        if new_value in ("DOWN", "DRAIN"):
+            await self.prompt_for_reason(affected_object.node_name, new_value)
+            return False
+        await affected_object.set_state(new_value)
+        return True
+
+    _COLUMN_HANDLERS: ClassVar[Dict[str, Callable[..., Awaitable[Any]]]] = {
+        "State": _update_state,
+    }
+
     async def on_cell_update(self, position: TablePosition, new_value: str) -> None:
         affected_object = self.model.get_data_object_for_row(position.row)
-        try:
-            match (position.column):
-                case "State":
-                    if new_value in ("DOWN", "DRAIN"):
-                        return await self.prompt_for_reason(
-                            affected_object.node_name, new_value
-                        )
-                    else:
-                        await affected_object.set_state(new_value)
-                case unknown_name:
-                    raise AttributeError(f"Don't know how to change {unknown_name}")
-            await self.refresh()
+        handler = self._COLUMN_HANDLERS.get(position.column)
+        if handler is None:
+            raise AttributeError(f"Don't know how to change {position.column}")
 
+        try:
+            # the state is only changed after we got a reason for some states
+            if await handler(self, affected_object, new_value):
+                await self.refresh()
         except (SlurmControlError, SlurmObjectException) as error:
             await self.app.display_error(error)
 
 
+# sidebar titles and the controllers they open, resolved once at import
+_SIDEBAR_ENTRIES: Tuple[Tuple[str, Type[InteractiveTableController]], ...] = (
+    (JobTableController.model_class.title, JobTableController),
+    (AssociationTableController.model_class.title, AssociationTableController),
+    (NodeTableController.model_class.title, NodeTableController),
+)
+
+
 if __name__ == "__main__":
     main()
@@ -1,11 +1,10 @@
-from collections import defaultdict
+import asyncio
 from contextlib import suppress
+from itertools import groupby
+from operator import attrgetter
 from os import path
-from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple, Type
-from io import StringIO
+from typing import Any, ClassVar, Dict, Iterable, List, Mapping, Sequence, Tuple, Type
 
-from rich.tree import Tree
-from rich.console import Console
 from textual.app import App
 from dlmanage.slurmbridge.scontrol import SlurmControlError
 
@@ -31,34 +30,79 @@ from dlmanage.slurmbridge import (
 )
 
 
+# the class of a cell and the kwargs it is created with
+CellClass = Tuple[Type[TableCell], Dict[str, Any]]
+# the allocated and total cpus and gpus of a node
+NodeAllocation = Tuple[Tuple[str, str], Tuple[str, str]]
+
+
 def get_association_with_lowest_grp_tres(
     object: Association, resource: str
 ) -> Association:
-    lowest_value = getattr(object, resource)
+    get_limit = attrgetter(resource)
+    own_value = get_limit(object)
+    lowest_value = int(own_value) if own_value is not None else None
     parent_with_lowest_value = object
-    while object.parent_object is not None:
-        parent_value = getattr(object.parent_object, resource)
-        if lowest_value is None:
-            lowest_value = parent_value
-            if lowest_value is not None:
-                parent_with_lowest_value = object.parent_object
-        elif parent_value is not None:
-            if int(parent_value) < int(lowest_value):
+    parent = object.parent_object
+    # a limit of 0 can't be undercut, so there is no need to look further up
+    while parent is not None and lowest_value != 0:
+        parent_value = get_limit(parent)
+        if parent_value is not None:
+            parent_value = int(parent_value)
+            if lowest_value is None or parent_value < lowest_value:
                 lowest_value = parent_value
-                parent_with_lowest_value = object.parent_object
+                parent_with_lowest_value = parent
 
-        object = object.parent_object
+        parent = parent.parent_object
 
     return parent_with_lowest_value
 
 
+def find_associations_with_lowest_grp_tres(
+    associations: Iterable[Association], resource: str
+) -> Dict[int, Association]:
+    # maps every association id to the one with the lowest limit up its hierarchy.
+    # the associations come in tree order, so a parent is always resolved before its
+    # children and every association only needs to be compared with its parents result
+    bottlenecks: Dict[int, Association] = {}
+    # the parsed limit of each bottleneck so every limit is only converted once
+    lowest_limits: Dict[int, int | None] = {}
+    get_limit = attrgetter(resource)
+    for association in associations:
+        own_value = get_limit(association)
+        bottleneck = association
+        lowest_limit = int(own_value) if own_value is not None else None
+        parent = association.parent_object
+        if parent is not None:
+            parent_bottleneck = bottlenecks.get(id(parent))
+            if parent_bottleneck is not None:
+                parent_limit = lowest_limits[id(parent)]
+            else:
+                parent_bottleneck = get_association_with_lowest_grp_tres(
+                    parent, resource
+                )
+                parent_value = get_limit(parent_bottleneck)
+                parent_limit = int(parent_value) if parent_value is not None else None
+            if parent_limit is not None and (
+                lowest_limit is None or parent_limit < lowest_limit
+            ):
+                bottleneck, lowest_limit = parent_bottleneck, parent_limit
+        bottlenecks[id(association)] = bottleneck
+        lowest_limits[id(association)] = lowest_limit
+
+    return bottlenecks
+
+
 def get_bottleneck_hint(
-    object: Association, resource: str
+    object: Association, resource: str, bottleneck: Association | None = None
 ) -> Tuple[str | None, str | None]:
     hint, placeholder = None, "∞"
     own_value = getattr(object, resource)
-    bottleneck = get_association_with_lowest_grp_tres(object, resource)
-    bottleneck_value = getattr(bottleneck, resource) if bottleneck != object else None
+    if bottleneck is None:
+        bottleneck = get_association_with_lowest_grp_tres(object, resource)
+    bottleneck_value = (
+        getattr(bottleneck, resource) if bottleneck is not object else None
+    )
     if bottleneck_value is not None and own_value is not None:
         if int(bottleneck_value) < int(own_value):
             hint = f"shadowed by {bottleneck.account}({bottleneck_value})"
@@ -72,63 +116,214 @@ def get_bottleneck_hint(
     return hint, placeholder
 
 
-def build_account_tree(root_node: Association) -> Sequence[str]:
-    def build_tree(tree: Tree, root: Association):
-        node: Tree
-        if isinstance(root, User):
-            node = tree.add(root.user)
-        else:
-            node = tree.add(root.account)
+# the guides rich uses to draw a tree, emitting them ourselves skips rendering the tree
+TREE_FORK, TREE_END = "├── ", "└── "
+TREE_CONTINUE, TREE_SPACE = "│   ", "    "
 
-        for child in root.children:
-            build_tree(node, child)
 
-    tree = Tree("All Associations", hide_root=True)
-    build_tree(tree, root_node)
-    tree_buffer = StringIO()
-    console = Console(file=tree_buffer, width=500)
-    console.print(tree)
-    return tree_buffer.getvalue().splitlines()
+def build_account_tree(root_node: Association) -> Sequence[str]:
+    lines: List[str] = []
+    # every entry holds a node, the guides of its ancestors and its own guide
+    stack: List[Tuple[Association, str, str]] = [(root_node, "", "")]
+    while stack:
+        node, prefix, guide = stack.pop()
+        label = node.user if isinstance(node, User) else node.account
+        lines.append(f"{prefix}{guide}{label}")
+
+        # the root is drawn without guides, so its children don't indent
+        if guide:
+            prefix += TREE_SPACE if guide == TREE_END else TREE_CONTINUE
+        children = node.children
+        # push in reverse so the first child is drawn first
+        for index in range(len(children) - 1, -1, -1):
+            child_guide = TREE_END if index == len(children) - 1 else TREE_FORK
+            stack.append((children[index], prefix, child_guide))
+
+    return lines
 
 
 def build_job_tree(jobs: Sequence[Job], attribute_name: str):
-    jobs_by_attribute: defaultdict[str, List[Job]] = defaultdict(list)
+    # the jobs have to be sorted by the attribute so every group is contiguous
+    tree_lines: List[str] = []
     joblist_for_tree: List[Job | None] = []
-    tree = Tree("All Jobs", hide_root=True)
-    for job in jobs:
-        jobs_by_attribute[getattr(job, attribute_name)].append(job)
-
-    for node_name, joblist in jobs_by_attribute.items():
-        node = tree.add(node_name)
-        joblist_for_tree.append(None)
-        for job in joblist:
-            joblist_for_tree.append(job)
-            node.add(job.job_id_with_array)
 
-    tree_buffer = StringIO()
-    console = Console(file=tree_buffer, width=500)
-    console.print(tree)
+    add_line, add_lines = tree_lines.append, tree_lines.extend
+    add_row, add_rows = joblist_for_tree.append, joblist_for_tree.extend
+    # the groups are the top level of the tree and drawn without guides
+    for node_name, group in groupby(jobs, key=attrgetter(attribute_name)):
+        joblist = list(group)
+        add_line(str(node_name))
+        add_lines(f"{TREE_FORK}{job.job_id_with_array}" for job in joblist[:-1])
+        add_line(f"{TREE_END}{joblist[-1].job_id_with_array}")
+        add_row(None)
+        add_rows(joblist)
 
-    return tree_buffer.getvalue().splitlines(), joblist_for_tree
+    return tree_lines, joblist_for_tree
 
 
 class AssociationListModel(InteractiveTableModel[User | Account]):
     title = "Users and Accounts"
-
-    def __init__(self):
-        self._columns: Mapping[str, Mapping[str, Any]] = {
-            "account": {"ratio": 3, "no_wrap": True},
-            "user": {"ratio": 2, "no_wrap": True},
-            "CPUs": {"justify": "center", "ratio": 2, "no_wrap": True},
-            "GPUs": {"justify": "center", "ratio": 2, "no_wrap": True},
-            "Timelimit": {"justify": "right", "ratio": 2, "no_wrap": True},
-            "Home Directory": {"justify": "right", "ratio": 2, "no_wrap": True},
-        }
+    _columns: ClassVar[Mapping[str, Mapping[str, Any]]] = {
+        "account": {"ratio": 3, "no_wrap": True},
+        "user": {"ratio": 2, "no_wrap": True},
+        "CPUs": {"justify": "center", "ratio": 2, "no_wrap": True},
+        "GPUs": {"justify": "center", "ratio": 2, "no_wrap": True},
+        "Timelimit": {"justify": "right", "ratio": 2, "no_wrap": True},
+        "Home Directory": {"justify": "right", "ratio": 2, "no_wrap": True},
+    }
+    # cells that look the same in every row share their kwargs
+    _STATIC_CELL_CLASSES: ClassVar[Dict[str, CellClass]] = {
+        "Timelimit": (EditableTableCell, {}),
+        "Home Directory": (
+            TableCell,
+            {"can_focus": False, "placeholder": "<not found>"},
+        ),
+    }
+    _USER_NAME_CELL: ClassVar[CellClass] = (EditableTableCell, {"can_focus": True})
+    _ACCOUNT_NAME_CELL: ClassVar[CellClass] = (TableCell, {"can_focus": False})
+    # what the derived structures were built from on the last load
+    _data_signature: Tuple[Any, ...] | None = None
 
     async def load_data(self):
         self._data = await Association.all()
-        self._available_accounts = await Account.all()
-        self.account_tree = build_account_tree(self._data[0])
+        # the association tree already lists every account, querying them on
+        # their own would only cost another sacctmgr call
+        self._available_accounts = sorted(
+            {
+                row_object.account: row_object
+                for row_object in self._data
+                if isinstance(row_object, Account)
+            }.values(),
+            key=attrgetter("account"),
+        )
+        # sacctmgr can't report changes, but the table is reloaded every second and
+        # mostly shows the same data. only rebuild what is derived from it on a change
+        if self._get_data_signature() != self._data_signature:
+            self.rebuild()
+
+    def _get_data_signature(self) -> Tuple[Any, ...]:
+        return (
+            tuple(
+                (
+                    type(row_object),
+                    row_object.nesting_level,
+                    row_object.account,
+                    row_object.user,
+                    row_object.grp_tres,
+                    row_object.grp_wall,
+                )
+                for row_object in self._data
+            ),
+            tuple(account.account for account in self._available_accounts),
+        )
+
+    def rebuild(self, tree_changed: bool = True):
+        # rebuild everything derived from the rows, e.g. after a row was saved in place.
+        # edits that don't move an entry can keep the lines of the account tree
+        self._data_signature = self._get_data_signature()
+        if tree_changed:
+            self.account_tree = build_account_tree(self._data[0])
+        # the limits only change with the rows, so resolve the bottlenecks once
+        self._bottlenecks: Dict[str, Dict[int, Association]] = {
+            resource: find_associations_with_lowest_grp_tres(self._data, resource)
+            for resource in ("max_cpus", "max_gpus")
+        }
+
+        # index the rows by the name they display so we can jump to an entry
+        # without scanning all cells
+        self._row_index: Dict[Tuple[str, str], int] = {}
+        for row, row_object in enumerate(self._data):
+            key = (
+                ("user", row_object.user)
+                if isinstance(row_object, User)
+                else ("account", row_object.account)
+            )
+            self._row_index.setdefault(key, row)
+
+        self._cell_texts = self._build_cell_texts()
+        self._cell_classes = self._build_cell_classes()
+
+    def _build_cell_texts(self) -> Dict[str, List[str | None]]:
+        # the texts only change on reload, so resolve all of them column by column
+        # instead of dispatching on the column name for every cell
+        users = [
+            row_object if isinstance(row_object, User) else None
+            for row_object in self._data
+        ]
+        return {
+            "account": list(self.account_tree),
+            "user": [user.user if user is not None else "" for user in users],
+            "CPUs": list(map(attrgetter("max_cpus"), self._data)),
+            "GPUs": list(map(attrgetter("max_gpus"), self._data)),
+            "Timelimit": list(map(attrgetter("grp_wall"), self._data)),
+            "Home Directory": [
+                user.home_directory if user is not None else "" for user in users
+            ],
+        }
+
+    def _build_cell_classes(self) -> Dict[str, List[CellClass]]:
+        cell_classes: Dict[str, List[CellClass]] = {
+            "account": [],
+            "user": [],
+            "CPUs": [],
+            "GPUs": [],
+        }
+        all_choices = [account.account for account in self._available_accounts]
+        choice_index: Dict[str, int] = {}
+        for index, choice in enumerate(all_choices):
+            choice_index.setdefault(choice, index)
+
+        for row_object in self._data:
+            choices = all_choices
+            current_value = row_object.account
+            selected_index = choice_index.get(current_value)
+            if isinstance(row_object, Account):
+                # don't display the account itself as a choice
+                current_value = (
+                    row_object.parent_object.account
+                    if row_object.parent_object is not None
+                    else ""
+                )
+                selected_index = choice_index.get(current_value)
+                own_index = choice_index.get(row_object.account)
+                if own_index is not None:
+                    choices = all_choices[:own_index] + all_choices[own_index + 1 :]
+                    if current_value == row_object.account:
+                        selected_index = None
+                    elif selected_index is not None and selected_index > own_index:
+                        # the choices after the account itself moved up by one
+                        selected_index -= 1
+            cell_classes["account"].append(
+                (
+                    EditableChoiceTableCell,
+                    {"choices": choices, "selected_index": selected_index},
+                )
+            )
+
+            # only user objects can set a new name
+            cell_classes["user"].append(
+                self._USER_NAME_CELL
+                if isinstance(row_object, User)
+                else self._ACCOUNT_NAME_CELL
+            )
+
+            for column, resource in (("CPUs", "max_cpus"), ("GPUs", "max_gpus")):
+                hint, placeholder = get_bottleneck_hint(
+                    row_object,
+                    resource,
+                    self._bottlenecks[resource][id(row_object)],
+                )
+                cell_classes[column].append(
+                    (
+                        EditableIntTableCell,
+                        {"min_value": 0, "placeholder": placeholder, "hint": hint},
+                    )
+                )
+
+        return cell_classes
+
+    def find_row(self, column: str, value: str) -> int | None:
+        return self._row_index.get((column, value))
 
     def get_columns(self):
         return self._columns.keys()
@@ -142,121 +337,136 @@ class AssociationListModel(InteractiveTableModel[User | Account]):
     def get_data_object_for_row(self, row: int):
         return self._data[row]
 
-    async def get_cell(self, position: TablePosition):
-        column, row = position
-        row_object = self._data[row]
-        cell_text: str | None = None
-        match column:
-            case "account":
-                cell_text = self.account_tree[row]
-            case "user":
-                cell_text = row_object.user if isinstance(row_object, User) else ""
-            case "CPUs":
-                cell_text = row_object.max_cpus
-            case "GPUs":
-                cell_text = row_object.max_gpus
-            case "Timelimit":
-                cell_text = row_object.grp_wall
-            case "Home Directory":
-                cell_text = (
-                    row_object.home_directory if isinstance(row_object, User) else ""
-                )
-            case unknown_name:
-                raise AttributeError(f"Unknown column: {unknown_name}")
-
-        return cell_text
-
-    async def get_cell_class(
-        self, position: TablePosition
-    ) -> Tuple[Type[TableCell], Dict[str, Any]]:
-        row_object = self._data[position.row]
-        match position.column:
-            case "account":
-                selected_index: int
-                choices = [account.account for account in self._available_accounts]
-                current_value = row_object.account
-                if isinstance(row_object, Account):
-                    # don't display the account itself as a choice
-                    choices = [
-                        account for account in choices if account != row_object.account
-                    ]
-                    current_value = (
-                        row_object.parent_object.account
-                        if row_object.parent_object is not None
-                        else ""
-                    )
-                try:
-                    selected_index = choices.index(current_value)
-                except ValueError:
-                    selected_index = 0
-
-                return EditableChoiceTableCell, {
-                    "choices": choices,
-                    "selected_index": selected_index,
-                }
-            case "user":
-                # only user objects can set a new name
-                is_user = isinstance(row_object, User)
-                cell_class = EditableTableCell if is_user else TableCell
-                return cell_class, {"can_focus": is_user}
-            case "CPUs":
-                hint, placeholder = get_bottleneck_hint(row_object, "max_cpus")
-                return EditableIntTableCell, {
-                    "min_value": 0,
-                    "placeholder": placeholder,
-                    "hint": hint,
-                }
-            case "GPUs":
-                hint, placeholder = get_bottleneck_hint(row_object, "max_gpus")
-                return EditableIntTableCell, {
-                    "min_value": 0,
-                    "placeholder": placeholder,
-                    "hint": hint,
-                }
-            case "Timelimit":
-                return EditableTableCell, {}
-            case "Home Directory":
-                return TableCell, {
-                    "can_focus": False,
-                    "placeholder": "<not found>",
-                }
-            case unknown_name:
-                raise AttributeError(f"Unknown column: {unknown_name}")
+    async def get_cell(self, position: TablePosition) -> str | None:
+        column_texts = self._cell_texts.get(position.column)
+        if column_texts is None:
+            raise AttributeError(f"Unknown column: {position.column}")
+        return column_texts[position.row]
+
+    async def get_cell_class(self, position: TablePosition) -> CellClass:
+        cell_class = self._STATIC_CELL_CLASSES.get(position.column)
+        if cell_class is not None:
+            return cell_class
+        column_cell_classes = self._cell_classes.get(position.column)
+        if column_cell_classes is None:
+            raise AttributeError(f"Unknown column: {position.column}")
+        return column_cell_classes[position.row]
 
 
 class JobListModel(InteractiveTableModel[Job]):
     title = "Jobs"
-
-    def __init__(self):
-        super().__init__()
-        self._columns: Mapping[str, Mapping[str, Any]] = {
-            "Job ID": {"ratio": 2, "no_wrap": True},
-            "Job Name": {"justify": "center", "ratio": 3, "no_wrap": True},
-            "CPUs": {"justify": "right", "ratio": 1, "no_wrap": True},
-            "GPUs": {"justify": "right", "ratio": 1, "no_wrap": True},
-            "Memory": {"justify": "right", "ratio": 1, "no_wrap": True},
-            "Timelimit": {"justify": "right", "ratio": 2, "no_wrap": True},
-            "Output": {"justify": "center", "ratio": 1, "no_wrap": True},
-            "Node": {"justify": "right", "ratio": 1, "no_wrap": True},
-            "Runtime": {"justify": "right", "ratio": 2, "no_wrap": True},
-        }
+    _columns: ClassVar[Mapping[str, Mapping[str, Any]]] = {
+        "Job ID": {"ratio": 2, "no_wrap": True},
+        "Job Name": {"justify": "center", "ratio": 3, "no_wrap": True},
+        "CPUs": {"justify": "right", "ratio": 1, "no_wrap": True},
+        "GPUs": {"justify": "right", "ratio": 1, "no_wrap": True},
+        "Memory": {"justify": "right", "ratio": 1, "no_wrap": True},
+        "Timelimit": {"justify": "right", "ratio": 2, "no_wrap": True},
+        "Output": {"justify": "center", "ratio": 1, "no_wrap": True},
+        "Node": {"justify": "right", "ratio": 1, "no_wrap": True},
+        "Runtime": {"justify": "right", "ratio": 2, "no_wrap": True},
+    }
+    # cells that look the same in every row share their kwargs
+    _STATIC_CELL_CLASSES: ClassVar[Dict[str, CellClass]] = {
+        "Job ID": (TableCell, {}),
+        "Job Name": (TableCell, {}),
+        "Runtime": (TableCell, {}),
+        "Memory": (TableCell, {}),
+        "CPUs": (EditableIntTableCell, {"min_value": 0, "placeholder": "None"}),
+        "GPUs": (EditableIntTableCell, {"min_value": 0, "placeholder": "None"}),
+        "Node": (TableCell, {"placeholder": "", "can_focus": False}),
+        "Timelimit": (EditableTableCell, {}),
+    }
+    _GROUP_ROW_CELL: ClassVar[CellClass] = (TableCell, {"can_focus": False})
+    _VIEWABLE_OUTPUT_CELL: ClassVar[CellClass] = (
+        ClickableTableCell,
+        {"placeholder": "n/a"},
+    )
+    _MISSING_OUTPUT_CELL: ClassVar[CellClass] = (TableCell, {"placeholder": "n/a"})
 
     async def load_data(self):
         unordered_jobs = await Job.all()
 
-        def sort_function(job: Job):
+        def sort_function(job: Job) -> Tuple[str, int, str, str]:
             # None states are always at the top, then go all running jobs,
             # followed by a list of completed and pending jobs
             match job.job_state:
                 case None:
-                    return str(job.username) + "0" + str(job.job_id_with_array)
+                    state_rank, state = 0, ""
                 case "RUNNING":
-                    return str(job.username) + "1" + str(job.job_id_with_array)
+                    state_rank, state = 1, ""
                 case other:
-                    return str(job.username) + str(other) + str(job.job_id_with_array)
+                    state_rank, state = 2, other
+            return (str(job.username), state_rank, state, str(job.job_id_with_array))
 
         sorted_jobs = sorted(unordered_jobs, key=sort_function)
         self._job_tree, self._tree_list = build_job_tree(sorted_jobs, "username")
+        # logs often live on a network share, so only stat them once per load and
+        # do it in worker threads. the default executor caps how many run at once
+        output_files = {
+            job.std_out
+            for job in self._tree_list
+            if job is not None and job.std_out is not None
+        }
+        existing_files = await asyncio.gather(
+            *(asyncio.to_thread(path.exists, file) for file in output_files)
+        )
+        file_exists = dict(zip(output_files, existing_files))
+        self._output_viewable: List[bool] = [
+            job is not None and file_exists.get(job.std_out, False)
+            for job in self._tree_list
+        ]
+        self._cell_texts = self._build_cell_texts()
+
+    def _build_cell_texts(self) -> Dict[str, List[str | None]]:
+        # the texts only change on reload, so resolve all of them row by row
+        # instead of dispatching on the column name for every cell
+        cell_texts: Dict[str, List[str | None]] = {
+            column: [] for column in self._columns
+        }
+        job_ids = cell_texts["Job ID"]
+        job_names = cell_texts["Job Name"]
+        cpus = cell_texts["CPUs"]
+        gpus = cell_texts["GPUs"]
+        memory = cell_texts["Memory"]
+        time_limits = cell_texts["Timelimit"]
+        outputs = cell_texts["Output"]
+        nodes = cell_texts["Node"]
+        runtimes = cell_texts["Runtime"]
+        # group rows only show the name of the group in the tree column
+        group_row_columns = [
+            column_texts
+            for column, column_texts in cell_texts.items()
+            if column != "Job ID"
+        ]
+        get_job_fields = attrgetter("job_name", "cpus", "gpus", "memory", "time_limit")
+        for tree_node, row_object, can_be_viewed in zip(
+            self._job_tree, self._tree_list, self._output_viewable
+        ):
+            job_ids.append(tree_node)
+            if row_object is None:
+                for column_texts in group_row_columns:
+                    column_texts.append("")
+                continue
+
+            job_name, job_cpus, job_gpus, job_memory, time_limit = get_job_fields(
+                row_object
+            )
+            job_names.append(job_name)
+            cpus.append(job_cpus)
+            gpus.append(job_gpus)
+            memory.append(job_memory)
+            time_limits.append(time_limit)
+            outputs.append("view" if can_be_viewed else None)
+            nodes.append(row_object.node_list or "")
+            runtime = row_object.run_time
+            if row_object.job_state != "RUNNING":
+                runtime = row_object.job_state
+                if row_object.reason is not None:
+                    runtime += f" ({row_object.reason})"
+            runtimes.append(runtime)
+
+        return cell_texts
 
     def get_columns(self) -> Iterable[str]:
         return self._columns.keys()
@@ -271,81 +481,98 @@ class JobListModel(InteractiveTableModel[Job]):
         return self._tree_list[row]
 
     async def get_cell(self, position: TablePosition) -> str | None:
-        tree_node = self._job_tree[position.row]
-        row_object = self._tree_list[position.row]
-        if row_object is None and position.column != "Job ID":
-            return ""
-
-        match (position.column):
-            case "Job ID":
-                return tree_node
-            case "Job Name":
-                return row_object.job_name
-            case "CPUs":
-                return row_object.cpus
-            case "GPUs":
-                return row_object.gpus
-            case "Memory":
-                return row_object.memory
-            case "Timelimit":
-                return row_object.time_limit
-            case "Output":
-                can_be_viewed = row_object.std_out is not None and path.exists(
-                    row_object.std_out
-                )
-                return "view" if can_be_viewed else None
-            case "Node":
-                return row_object.node_list or ""
-            case "Runtime":
-                cell_text = row_object.run_time
-                if row_object.job_state != "RUNNING":
-                    cell_text = row_object.job_state
-                    if row_object.reason is not None:
-                        cell_text += f" ({row_object.reason})"
-                return cell_text
-            case unknown_name:
-                raise AttributeError(f"Unknown column: {unknown_name}")
-
-    async def get_cell_class(
-        self, position: TablePosition
-    ) -> Tuple[Type[TableCell], Dict[str, Any]]:
-        row_object = self._tree_list[position.row]
-        if row_object is None:
-            return TableCell, {"can_focus": False}
-
-        match (position.column):
-            case "Job ID" | "Job Name" | "Runtime" | "Memory":
-                return TableCell, {}
-            case "CPUs" | "GPUs":
-                return EditableIntTableCell, {"min_value": 0, "placeholder": "None"}
-            case "Node":
-                return TableCell, {"placeholder": "", "can_focus": False}
-            case "Timelimit":
-                return EditableTableCell, {}
-            case "Output":
-                can_be_viewed = row_object.std_out is not None and path.exists(
-                    row_object.std_out
-                )
-                cell_class = ClickableTableCell if can_be_viewed else TableCell
-                return cell_class, {"placeholder": "n/a"}
-            case unknown_name:
-                raise AttributeError(f"Unknown column: {unknown_name}")
+        column_texts = self._cell_texts.get(position.column)
+        if column_texts is None:
+            raise AttributeError(f"Unknown column: {position.column}")
+        return column_texts[position.row]
+
+    async def get_cell_class(self, position: TablePosition) -> CellClass:
+        if self._tree_list[position.row] is None:
+            return self._GROUP_ROW_CELL
+        cell_class = self._STATIC_CELL_CLASSES.get(position.column)
+        if cell_class is not None:
+            return cell_class
+        if position.column == "Output":
+            if self._output_viewable[position.row]:
+                return self._VIEWABLE_OUTPUT_CELL
+            return self._MISSING_OUTPUT_CELL
+        raise AttributeError(f"Unknown column: {position.column}")
 
 
 class NodeListModel(InteractiveTableModel[Node]):
     title = "Nodes"
-
-    def __init__(self):
-        self._columns: Mapping[str, Mapping[str, Any]] = {
-            "Node Name": {"ratio": 1, "no_wrap": True},
-            "State": {"ratio": 1, "no_wrap": True},
-            "CPU Load": {"justify": "center", "ratio": 2, "no_wrap": True},
-            "GPU Load": {"justify": "center", "ratio": 2, "no_wrap": True},
-            "Uptime": {"justify": "right", "ratio": 1, "no_wrap": True},
-        }
+    _columns: ClassVar[Mapping[str, Mapping[str, Any]]] = {
+        "Node Name": {"ratio": 1, "no_wrap": True},
+        "State": {"ratio": 1, "no_wrap": True},
+        "CPU Load": {"justify": "center", "ratio": 2, "no_wrap": True},
+        "GPU Load": {"justify": "center", "ratio": 2, "no_wrap": True},
+        "Uptime": {"justify": "right", "ratio": 1, "no_wrap": True},
+    }
+    # cells that look the same in every row share their kwargs
+    _STATIC_CELL_CLASSES: ClassVar[Dict[str, CellClass]] = {
+        "Node Name": (TableCell, {"can_focus": False}),
+        "Uptime": (TableCell, {"can_focus": False}),
+        "State": (EditableChoiceTableCell, {"choices": Node.STATES}),
+    }
 
     async def load_data(self):
         self._data = await Node.all()
+        # both builders need the allocations, read them only once per row
+        allocations = [
+            (row_object.cpu_allocation, row_object.gpu_allocation)
+            for row_object in self._data
+        ]
+        self._cell_texts = self._build_cell_texts(allocations)
+        self._cell_classes = self._build_cell_classes(allocations)
+
+    def _build_cell_texts(
+        self, allocations: Sequence[NodeAllocation]
+    ) -> Dict[str, List[str | None]]:
+        # the texts only change on reload, so resolve all of them row by row
+        # instead of dispatching on the column name for every cell
+        cell_texts: Dict[str, List[str | None]] = {
+            column: [] for column in self._columns
+        }
+        for row_object, (cpu_allocation, gpu_allocation) in zip(
+            self._data, allocations
+        ):
+            state = row_object.state
+            if row_object.reason is not None:
+                state += f" ({row_object.reason})"
+            cpus_allocated, cpus_total = cpu_allocation
+            gpus_allocated, gpus_total = gpu_allocation
+            cell_texts["Node Name"].append(row_object.node_name)
+            cell_texts["State"].append(state)
+            cell_texts["CPU Load"].append(f"{cpus_allocated} / {cpus_total}")
+            cell_texts["GPU Load"].append(f"{gpus_allocated} / {gpus_total}")
+            cell_texts["Uptime"].append(
+                str(row_object.uptime) if row_object.uptime else None
+            )
+
+        return cell_texts
+
+    def _build_cell_classes(
+        self, allocations: Sequence[NodeAllocation]
+    ) -> Dict[str, List[CellClass]]:
+        cell_classes: Dict[str, List[CellClass]] = {"CPU Load": [], "GPU Load": []}
+        for cpu_allocation, gpu_allocation in allocations:
+            for column, (allocated, total) in (
+                ("CPU Load", cpu_allocation),
+                ("GPU Load", gpu_allocation),
+            ):
+                current_load: float = 0
+                try:
+                    current_load = (int(allocated) / int(total)) * 100
+                except ValueError:
+                    pass
+                cell_classes[column].append(
+                    (
+                        ProgressTableCell,
+                        {"can_focus": False, "fill_percent": current_load},
+                    )
+                )
+
+        return cell_classes
 
     def get_columns(self) -> Iterable[str]:
         return self._columns.keys()
@@ -360,55 +587,16 @@ class NodeListModel(InteractiveTableModel[Node]):
         return self._data[row]
 
     async def get_cell(self, position: TablePosition) -> str | None:
-        row_object = self._data[position.row]
-        match (position.column):
-            case "Node Name":
-                return row_object.node_name
-            case "State":
-                cell_text = row_object.state
-                if row_object.reason is not None:
-                    cell_text += f" ({row_object.reason})"
-                return cell_text
-            case "CPU Load":
-                allocated, total = row_object.cpu_allocation
-                return f"{allocated} / {total}"
-            case "GPU Load":
-                allocated, total = row_object.gpu_allocation
-                return f"{allocated} / {total}"
-            case "Uptime":
-                return str(row_object.uptime) if row_object.uptime else None
-            case unknown_name:
-                raise AttributeError(f"Unknown column: {unknown_name}")
-
-    async def get_cell_class(
-        self, position: TablePosition
-    ) -> Tuple[Type[TableCell], Dict[str, Any]]:
-        row_object = self._data[position.row]
-        current_load: float = 0
-        match (position.column):
-            case "Node Name" | "Uptime":
-                return TableCell, {"can_focus": False}
-            case "CPU Load":
-                try:
-                    allocated, total = row_object.cpu_allocation
-                    current_load = (int(allocated) / int(total)) * 100
-                except ValueError:
-                    pass
-                return ProgressTableCell, {
-                    "can_focus": False,
-                    "fill_percent": current_load,
-                }
-            case "GPU Load":
-                try:
-                    allocated, total = row_object.gpu_allocation
-                    current_load = (int(allocated) / int(total)) * 100
-                except ValueError:
-                    pass
-                return ProgressTableCell, {
-                    "can_focus": False,
-                    "fill_percent": current_load,
-                }
-            case "State":
-                return EditableChoiceTableCell, {"choices": Node.STATES}
-            case unknown_name:
-                raise AttributeError(f"Unknown column: {unknown_name}")
+        column_texts = self._cell_texts.get(position.column)
+        if column_texts is None:
+            raise AttributeError(f"Unknown column: {position.column}")
+        return column_texts[position.row]
+
+    async def get_cell_class(self, position: TablePosition) -> CellClass:
+        cell_class = self._STATIC_CELL_CLASSES.get(position.column)
+        if cell_class is not None:
+            return cell_class
+        column_cell_classes = self._cell_classes.get(position.column)
+        if column_cell_classes is None:
+            raise AttributeError(f"Unknown column: {position.column}")
+        return column_cell_classes[position.row]
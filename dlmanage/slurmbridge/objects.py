@@ -52,6 +52,9 @@ class Association(SlurmAccountManagerObject[AssociationType]):
     user: str | None = field(read_only=True)
     partition: str = field(repr=False)
     children: List[Association] = field(default_factory=lambda: list(), synthetic=True)
+    nearest_account: Account | None = field(
+        repr=False, compare=False, synthetic=True, default=None
+    )
     grp_tres_mins: str | None = dataclasses.field(repr=False, default=None)
     grp_tres_run_mins: str | None = dataclasses.field(repr=False, default=None)
     grp_tres: str | None = dataclasses.field(repr=False, default=None)
@@ -100,6 +103,13 @@ class Association(SlurmAccountManagerObject[AssociationType]):
             # build the tree
             if parent is not None:
                 parent.children.append(instance)
+            # remember the closest account up the hierarchy so we don't have
+            # to walk the parent chain every time we need it
+            if instance_type is Account:
+                # checked on the type, isinstance would narrow the shared instance
+                instance.nearest_account = cast(Account, instance)
+            elif parent is not None:
+                instance.nearest_account = parent.nearest_account
             hierarchy_stack[nesting_level] = instance
             instances.append(instance)
         return instances
@@ -132,6 +142,7 @@ class Account(Association["Account"], WritableSlurmAccountManagerObject["Account
         await self._scattmgr_write("modify", updates, filters)
         self.parent = new_paernt
         await self.refresh_from_db()
+        self.nearest_account = self
 
     def __str__(self) -> str:
         return f"Account {self.account}"
@@ -161,6 +172,7 @@ class User(Association["User"], WritableSlurmAccountManagerObject["User"]):
             await self._scattmgr_write("delete", {}, filters)
 
         await self.refresh_from_db()
+        self.nearest_account = new_account
 
     async def set_new_username(self, new_name: str):
         if not new_name:
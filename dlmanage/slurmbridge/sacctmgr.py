@@ -213,7 +213,13 @@ class WritableSlurmAccountManagerObject(
     ) -> WritableAccountManagerObjectType:
         created_objects = await cls._scattmgr_write("create", attrs, {})
         if len(created_objects) == 1:
-            return await cls.get(**attrs)
+            # write only values like the parent of an account can't be queried
+            filters = {
+                name: value
+                for name, value in attrs.items()
+                if name not in cls._write_only_fields
+            }
+            return await cls.get(**filters)
         else:
             raise SlurmAccountManagerError(
                 cls,
@@ -0,0 +1,27 @@
+from typing import Final
+
+from rich.style import Style, NULL_STYLE
+
+from dlmanage.widgets import TableTheme
+
+
+class AppTheme(TableTheme):
+    # main colors: #007AD0, #729900, #CD652A
+    __slots__ = ()
+
+    cell = Style(color="bright_white")
+    header = Style(color="#CD652A")
+    text_cell = Style(color="#007AD0")
+    int_cell = Style(color="#729900")
+    hovered_cell = Style(bold=True, underline=True)
+    selected_row = Style(bgcolor="gray19")
+    choice_cell = Style(color="#007AD0")
+    focused_cell = Style(
+        color="#729900", bgcolor="gray30", bold=True, underline=True, overline=True
+    )
+    editing_cell = Style(color="green", bgcolor="gray30", bold=True, underline=False)
+    focused_border_style = NULL_STYLE
+    blurred_border_style = Style(color="gray62")
+
+
+THEME: Final = AppTheme()
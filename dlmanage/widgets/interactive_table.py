@@ -1,4 +1,5 @@
 from __future__ import annotations
+import asyncio
 
 from contextlib import suppress
 import threading
@@ -44,6 +45,9 @@ TablePosition = NamedTuple("TablePosition", (("column", str), ("row", int)))
 
 
 class TableTheme:
+    # all styles are shared class attributes, instances don't need a __dict__
+    __slots__ = ()
+
     cell = Style(color="gray62")
     text_cell = Style(color="white")
     int_cell = Style(color="green")
@@ -164,6 +168,7 @@ class EditableTableCell(TableCell):
     is_editing: Reactive[bool] = Reactive(False, layout=True)
     cursor_position: Reactive[int] = Reactive(0, layout=True)
     value: Reactive[str] = Reactive("", layout=True)
+    _value_before_edit: Any = None
 
     def __init__(
         self,
@@ -192,8 +197,15 @@ class EditableTableCell(TableCell):
         self.value = self.text or ""
         self.is_editing = True
         self.cursor_position = len(self.value)
+        self._remember_value_before_edit()
         await self.emit(CellStartedEditing(self, self.position))
 
+    def _remember_value_before_edit(self):
+        try:
+            self._value_before_edit = self.to_value()
+        except Exception:
+            self._value_before_edit = None
+
     async def abort_edit(self):
         self.is_editing = False
         await self.emit(CellFinishedEditing(self, self.position))
@@ -207,7 +219,9 @@ class EditableTableCell(TableCell):
         except Exception:
             pass
         else:
-            await self.emit(CellEdited(self, self.position, new_value))
+            # committing an unchanged value would only cost a round trip to slurm
+            if new_value != self._value_before_edit:
+                await self.emit(CellEdited(self, self.position, new_value))
 
         await self.emit(CellFinishedEditing(self, self.position))
 
@@ -239,6 +253,9 @@ class EditableTableCell(TableCell):
                 # allow deleting the cell without entering edit mode
                 case "ctrl+h" | "delete":
                     event.stop()
+                    # the cleared value has to be compared with the current one
+                    self.value = self.text or ""
+                    self._remember_value_before_edit()
                     self.value = ""
                     await self.commit_edit()
                     return
@@ -324,6 +341,7 @@ class EditableIntTableCell(EditableTableCell):
         self.value = self.text or ""
         self.cursor_position = len(self.value)
         self.is_editing = True
+        self._remember_value_before_edit()
 
     def to_value(self) -> Any:
         if not self.value.strip():
@@ -364,7 +382,7 @@ class EditableChoiceTableCell(EditableTableCell):
         placeholder: str = "<undefined>",
         hint: Optional[str] = None,
         choices: Optional[List[str]] = None,
-        selected_index: Optional[int] = 0,
+        selected_index: Optional[int] = None,
         can_focus: bool = True,
     ):
         self.choices = choices or ([text] if text else [])
@@ -406,10 +424,15 @@ class EditableChoiceTableCell(EditableTableCell):
 
     async def begin_editing(self):
         await super().begin_editing()
-        try:
-            self.cursor_position = self.selected_index
-        except ValueError:
-            self.cursor_position = 0
+        self.cursor_position = self.selected_index or 0
+        self._remember_value_before_edit()
+
+    def _remember_value_before_edit(self):
+        # without a selected choice the current value is unknown, so every pick is sent
+        if self.selected_index is None:
+            self._value_before_edit = None
+        else:
+            super()._remember_value_before_edit()
 
     def input_key(self, key_name: str) -> None:
         # jump to the first choice matching the entered key
@@ -809,6 +832,9 @@ class InteractiveTable(Widget):
 
 
 class InteractiveTableController(ABC, Bindings, Generic[ModelEntryType, AppType]):
+    # Bindings has no __slots__ so a __dict__ remains, but the hot attributes use slots
+    __slots__ = ("app", "model", "view", "interval_timer", "_refresh_lock")
+
     model_class: ClassVar[Type[InteractiveTableModel]]
     view_class: Type[InteractiveTable] = InteractiveTable
     theme_class: Type[TableTheme] = TableTheme
@@ -826,9 +852,14 @@ class InteractiveTableController(ABC, Bindings, Generic[ModelEntryType, AppType]
             theme=self.theme_class(),
         )
         self.view.model = self.model
+        # only one reload of the model may run at a time
+        self._refresh_lock = asyncio.Lock()
+        # only set while the controller is shown and its first load succeeded
+        self.interval_timer = None
 
     async def initialize(self):
-        self.view.is_loading = True
+        # a reopened controller keeps showing its previous data while reloading
+        self.view.is_loading = not self.view.cells
         await self.refresh()
         self.view.is_loading = False
         # set a timer to always keep the current model updated
@@ -837,14 +868,26 @@ class InteractiveTableController(ABC, Bindings, Generic[ModelEntryType, AppType]
         )
 
     async def uninitialize(self):
-        await self.interval_timer.stop()
+        if self.interval_timer is not None:
+            await self.interval_timer.stop()
+            self.interval_timer = None
 
     async def refresh_model_timer_callback(self):
+        # a reload that is already running brings the same data, skip this tick
+        if self._refresh_lock.locked():
+            return
         if self.model is not None and not self.view.is_in_edit_mode:
             await self.refresh()
 
     async def refresh(self):
-        await self.model.load_data()
+        # refreshes after an edit wait for a running reload and then load again,
+        # so they never show data from before the edit
+        async with self._refresh_lock:
+            await self.model.load_data()
+            await self.refresh_view()
+
+    async def refresh_view(self):
+        # show the current model data without querying it again
         await self.view.refresh_data_from_model()
         self.view.refresh()
 
@@ -1,5 +1,9 @@
+from __future__ import annotations
+import asyncio
+import os
+from collections import deque
 from pathlib import Path
-from typing import List
+from typing import BinaryIO, Deque, List, Sequence, TextIO, Tuple
 
 from rich.syntax import Syntax
 from rich.text import Text
@@ -9,31 +13,123 @@ from textual.widget import Widget
 from textual.messages import CursorMove
 
 
+# number of lines kept in the scrollback, older lines are dropped as new ones arrive
+MAX_SCROLLBACK_LINES = 10_000
+# new output is read in chunks, at most this many characters per check so a
+# flooding log can't stall the ui
+READ_CHUNK_SIZE = 64 * 1024
+MAX_READ_PER_CHECK = 1024 * 1024
+
+
+def _highlight_line(lexer: Syntax, line_number: int, line: str) -> Text:
+    line_number_color = lexer._get_line_numbers_color()
+    line_number_text = Text(f"{line_number:>6} ", style=Style(color=line_number_color))
+    return line_number_text.append(lexer.highlight(line))
+
+
+def _find_scrollback_start(raw_file: BinaryIO) -> Tuple[int, int]:
+    # returns the offset of the first line that fits into the scrollback and
+    # the number of lines before it. the file is scanned backwards from the end,
+    # the lines before the scrollback are only counted in binary
+    end = raw_file.seek(0, os.SEEK_END)
+    raw_file.seek(max(end - 1, 0))
+    # an unfinished last line is part of the scrollback as well
+    newlines_to_skip = MAX_SCROLLBACK_LINES
+    if raw_file.read(1) == b"\n":
+        newlines_to_skip += 1
+
+    start = 0
+    skipped_lines = 0
+    position = end
+    while position > 0:
+        chunk_size = min(READ_CHUNK_SIZE, position)
+        position -= chunk_size
+        raw_file.seek(position)
+        chunk = raw_file.read(chunk_size)
+        if newlines_to_skip == 0:
+            skipped_lines += chunk.count(b"\n")
+            continue
+        index = len(chunk)
+        while newlines_to_skip > 0 and (index := chunk.rfind(b"\n", 0, index)) >= 0:
+            newlines_to_skip -= 1
+        if newlines_to_skip == 0:
+            start = position + index + 1
+            skipped_lines += chunk.count(b"\n", 0, index + 1)
+    return start, skipped_lines
+
+
+def _open_log(file: Path, lexer: Syntax) -> Tuple[TextIO, int, int, List[Text]]:
+    log_file = file.open("r")
+    # only read and highlight the lines that fit into the scrollback but keep their line numbers
+    start, skipped_lines = _find_scrollback_start(log_file.buffer)
+    log_file.seek(start)
+    lines = log_file.readlines()
+    # the file may have grown since, everything after this offset is still unread
+    read_offset = log_file.tell()
+    highlighted_lines = [
+        _highlight_line(lexer, line_number, line)
+        for line_number, line in enumerate(lines, start=skipped_lines + 1)
+    ]
+    return log_file, read_offset, skipped_lines + len(lines), highlighted_lines
+
+
 class LogView(Widget):
     def __init__(
-        self, file: Path, name: str | None = None, lexer: str = "python"
+        self,
+        file: Path,
+        name: str | None = None,
+        lexer: str = "python",
+        *,
+        log_file: TextIO | None = None,
+        read_offset: int = 0,
+        line_count: int = 0,
+        initial_lines: Sequence[Text] = (),
     ) -> None:
         super().__init__(name)
         self.file_path = file
-        self.file = file.open("r")
         self.lexer = Syntax("", line_numbers=True, lexer=lexer)
-        self.lines: List[Text] = []
-        for line in self.file.readlines():
-            self.add_line(line)
+        if log_file is None:
+            log_file, read_offset, line_count, initial_lines = _open_log(
+                file, self.lexer
+            )
+        self.file = log_file
+        # size of the file when we last read it, used to skip reads if nothing changed
+        self._known_size = read_offset
+        self.lines: Deque[Text] = deque(initial_lines, maxlen=MAX_SCROLLBACK_LINES)
+        self.line_count = line_count
+        # the last line of the file if the writer didn't finish it yet
+        self._partial_line = ""
+        # the assembled text, rebuilt only after new lines were added
+        self._rendered: Text | None = None
 
         self.set_interval(1, self.check_for_new_lines)
 
         self.set_timer(0, self.scroll_to_bottom)
 
-    def add_line(self, line) -> Text:
-        line_number = len(self.lines) + 1
-        line_number_color = self.lexer._get_line_numbers_color()
-        line_number_text = Text(
-            f"{line_number:>6} ", style=Style(color=line_number_color)
+    @classmethod
+    async def open(
+        cls, file: Path, name: str | None = None, lexer: str = "python"
+    ) -> LogView:
+        # logs usually live on a network share and can be huge, so reading and
+        # highlighting them may take a while. do that in a worker thread to keep the ui alive
+        log_file, read_offset, line_count, initial_lines = await asyncio.to_thread(
+            _open_log, file, Syntax("", line_numbers=True, lexer=lexer)
         )
-        highlighted_line = self.lexer.highlight(line)
-        combined_line = line_number_text.append(highlighted_line)
+        return cls(
+            file,
+            name,
+            lexer,
+            log_file=log_file,
+            read_offset=read_offset,
+            line_count=line_count,
+            initial_lines=initial_lines,
+        )
+
+    def add_line(self, line) -> Text:
+        self.line_count += 1
+        combined_line = _highlight_line(self.lexer, self.line_count, line)
         self.lines.append(combined_line)
+        self._rendered = None
         return combined_line
 
     @property
@@ -50,16 +146,33 @@ class LogView(Widget):
         await self.emit(CursorMove(self, new_scroll_y))
 
     async def check_for_new_lines(self):
-        needs_refresh = False
-        while line := self.file.readline():
-            self.add_line(line)
-            needs_refresh = True
+        size = os.fstat(self.file.fileno()).st_size
+        if size == self._known_size:
+            return
+
+        new_output = self._partial_line
+        read_size = 0
+        while read_size < MAX_READ_PER_CHECK:
+            chunk = self.file.read(READ_CHUNK_SIZE)
+            if not chunk:
+                # only remember the size once everything is read, otherwise
+                # the rest of a large burst is picked up on the next check
+                self._known_size = size
+                break
+            new_output += chunk
+            read_size += len(chunk)
+
+        # everything after the last newline is kept until the line is complete
+        *new_lines, self._partial_line = new_output.split("\n")
+        for line in new_lines:
+            self.add_line(line + "\n")
 
-        if needs_refresh:
+        if new_lines:
             self.refresh(layout=True)
             if self.auto_scroll:
                 await self.scroll_to_bottom()
 
     def render(self):
-        text = Text().assemble(*self.lines)
-        return text
+        if self._rendered is None:
+            self._rendered = Text().assemble(*self.lines)
+        return self._rendered
@@ -0,0 +1,31 @@
+import pytest
+
+from dlmanage.slurmbridge import Association
+
+
+def parse_associations(lines):
+    # builds associations from "sacctmgr show association tree" style lines, the
+    # indentation of an account is its nesting level. a user is written as
+    # "account:user" and "=" starts the GrpTRES limits
+    response = []
+    for index, line in enumerate(lines):
+        line, _, grp_tres = line.partition("=")
+        account, _, user = line.partition(":")
+        response.append(
+            {
+                "Id": str(index + 1),
+                "ParentId": "",
+                "ParentName": "",
+                "Cluster": "cluster",
+                "Account": account,
+                "User": user,
+                "Partition": "",
+                "GrpTres": grp_tres,
+            }
+        )
+    return Association._response_to_instances(response)
+
+
+@pytest.fixture
+def associations():
+    return parse_associations
@@ -0,0 +1,96 @@
+import asyncio
+from types import SimpleNamespace
+
+from dlmanage.slurmbridge import Node
+from dlmanage.widgets.interactive_table import (
+    CellEdited,
+    EditableChoiceTableCell,
+    EditableIntTableCell,
+    EditableTableCell,
+    TablePosition,
+)
+
+
+def edit_cell(create_cell, edit):
+    # runs a full edit on a cell and returns the CellEdited messages it sent
+    sent = []
+
+    async def record(message):
+        sent.append(message)
+
+    async def run():
+        cell = create_cell()
+        cell.emit = record
+        await cell.begin_editing()
+        edit(cell)
+        await cell.commit_edit()
+
+    asyncio.run(run())
+    return [message for message in sent if isinstance(message, CellEdited)]
+
+
+def select_choice(index):
+    def edit(cell):
+        cell.cursor_position = index
+
+    return edit
+
+
+def test_unchanged_text_is_not_committed():
+    edited = edit_cell(
+        lambda: EditableTableCell(TablePosition("comment", 0), "unchanged"),
+        lambda cell: None,
+    )
+    assert edited == []
+
+
+def test_changed_text_is_committed():
+    def edit(cell):
+        cell.value = "changed"
+
+    edited = edit_cell(
+        lambda: EditableTableCell(TablePosition("comment", 0), "unchanged"), edit
+    )
+    assert [message.new_content for message in edited] == ["changed"]
+
+
+def test_selected_choice_is_not_committed():
+    edited = edit_cell(
+        lambda: EditableChoiceTableCell(
+            TablePosition("account", 0),
+            "b",
+            choices=["a", "b", "c"],
+            selected_index=1,
+        ),
+        select_choice(1),
+    )
+    assert edited == []
+
+
+def test_every_choice_is_committed_without_a_selection():
+    # the node state cell only lists the states a node can be set to, none of
+    # them is the current one, so even the first choice has to be sent
+    for index, state in enumerate(Node.STATES):
+        edited = edit_cell(
+            lambda: EditableChoiceTableCell(
+                TablePosition("State", 0), "IDLE", choices=Node.STATES
+            ),
+            select_choice(index),
+        )
+        assert [message.new_content for message in edited] == [state]
+
+
+def test_delete_clears_a_cell_without_editing():
+    sent = []
+
+    async def record(message):
+        sent.append(message)
+
+    async def run():
+        cell = EditableIntTableCell(TablePosition("CPUs", 0), "4")
+        cell.emit = record
+        await cell.on_key(SimpleNamespace(key="delete", stop=lambda: None))
+
+    asyncio.run(run())
+    edited = [message for message in sent if isinstance(message, CellEdited)]
+    assert [message.new_content for message in edited] == [None]
@@ -0,0 +1,39 @@
+from rich.syntax import Syntax
+
+from dlmanage.widgets import log_view
+from dlmanage.widgets.log_view import _open_log
+
+
+def open_log(path):
+    return _open_log(path, Syntax("", line_numbers=True, lexer="python"))
+
+
+def test_read_offset_is_where_reading_stopped(tmp_path):
+    log_path = tmp_path / "job.out"
+    log_path.write_text("first\nsecond\n")
+
+    log_file, read_offset, line_count, lines = open_log(log_path)
+    with log_file:
+        # output written after the initial read must still count as unread
+        with log_path.open("a") as writer:
+            writer.write("third\n")
+        assert read_offset == len("first\nsecond\n")
+        assert line_count == 2
+        assert log_file.read() == "third\n"
+
+
+def test_long_logs_keep_their_line_numbers(tmp_path, monkeypatch):
+    monkeypatch.setattr(log_view, "MAX_SCROLLBACK_LINES", 3)
+    monkeypatch.setattr(log_view, "READ_CHUNK_SIZE", 4)
+    log_path = tmp_path / "job.out"
+    log_path.write_text("".join(f"line {number}\n" for number in range(1, 8)))
+
+    log_file, _, line_count, lines = open_log(log_path)
+    log_file.close()
+    # only the scrollback is read, but the lines keep their numbers in the file
+    assert line_count == 7
+    assert [line.plain for line in lines] == [
+        "     5 line 5\n",
+        "     6 line 6\n",
+        "     7 line 7\n",
+    ]
@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+
+from dlmanage.main import AssociationTableController, SlurmControl
+from dlmanage.slurmbridge import Account, SlurmAccountManagerError, User
+
+
+def record_creates(monkeypatch, associations, rejected_parents):
+    created = []
+
+    async def create(**attrs):
+        if attrs.get("parent") in rejected_parents:
+            raise SlurmAccountManagerError(Account, "invalid parent")
+        created.append(attrs)
+        return associations([attrs["account"]])[0]
+
+    monkeypatch.setattr(Account, "create", create)
+    return created
+
+
+def test_account_is_created_under_its_parent(monkeypatch, associations):
+    created = record_creates(monkeypatch, associations, rejected_parents=())
+
+    asyncio.run(AssociationTableController._create_account("students", "teaching"))
+
+    assert created == [{"account": "students", "parent": "teaching"}]
+
+
+def test_rejected_parent_creates_the_account_at_the_default_place(
+    monkeypatch, associations
+):
+    created = record_creates(monkeypatch, associations, rejected_parents=("deleted",))
+
+    asyncio.run(AssociationTableController._create_account("students", "deleted"))
+
+    assert created == [{"account": "students"}]
+
+
+def test_rejected_root_is_reported(monkeypatch, associations):
+    record_creates(monkeypatch, associations, rejected_parents=("root",))
+
+    with pytest.raises(SlurmAccountManagerError):
+        asyncio.run(AssociationTableController._create_account("students", "root"))
+
+
+def test_errors_of_a_background_switch_are_shown():
+    app = SlurmControl.__new__(SlurmControl)
+    shown = []
+
+    async def open_controller(controller_class):
+        raise FileNotFoundError("sacctmgr could not be found in path.")
+
+    async def display_error(error):
+        shown.append(error)
+
+    app.open_controller = open_controller
+    app.display_error = display_error
+
+    async def run():
+        app.open_controller_in_background(AssociationTableController)
+        await app._switch_task
+
+    asyncio.run(run())
+    assert [str(error) for error in shown] == ["sacctmgr could not be found in path."]
+
+
+def test_saved_user_keeps_its_place_in_the_tree(monkeypatch, associations):
+    root, alice = associations(["root", " root:alice"])
+
+    async def write(verb, new_values, filters):
+        return ["alice"]
+
+    async def get(**filters):
+        # sacctmgr only returns the user itself, without the rest of the tree
+        return associations(["root:alice=cpu=4"])[0]
+
+    monkeypatch.setattr(User, "_scattmgr_write", staticmethod(write))
+    monkeypatch.setattr(User, "get", staticmethod(get))
+
+    alice.max_cpus = "4"
+    asyncio.run(AssociationTableController._save_association(None, alice))
+
+    assert alice.max_cpus == "4"
+    assert alice.parent_object is root
+    assert alice.nearest_account is root
+    assert root.children == [alice]
@@ -0,0 +1,159 @@
+import asyncio
+from io import StringIO
+from itertools import groupby
+from operator import attrgetter
+from types import SimpleNamespace
+
+from rich.console import Console
+from rich.tree import Tree
+
+from dlmanage.models import (
+    NodeListModel,
+    build_account_tree,
+    build_job_tree,
+    find_associations_with_lowest_grp_tres,
+    get_association_with_lowest_grp_tres,
+)
+from dlmanage.slurmbridge import Node, User
+from dlmanage.widgets.interactive_table import TablePosition
+
+
+def load_model(model, monkeypatch, object_class, objects):
+    async def all():
+        return objects
+
+    monkeypatch.setattr(object_class, "all", all)
+    asyncio.run(model.load_data())
+    return model
+
+
+def cell(model, column, row):
+    return asyncio.run(model.get_cell(TablePosition(column, row)))
+
+
+def cell_kwargs(model, column, row):
+    _, kwargs = asyncio.run(model.get_cell_class(TablePosition(column, row)))
+    return kwargs
+
+
+def test_node_loads(monkeypatch):
+    nodes = [
+        Node(
+            "gpu01",
+            cpualloc="16",
+            cputot="64",
+            gres="gpu:turing:4(S:0)",
+            gres_used="gpu:turing:1(IDX:0)",
+            state="MIXED",
+        ),
+        Node("cpu01", state="DOWN", reason="broken fan"),
+    ]
+    model = load_model(NodeListModel(), monkeypatch, Node, nodes)
+
+    assert cell(model, "State", 1) == "DOWN (broken fan)"
+    assert cell(model, "CPU Load", 0) == "16 / 64"
+    assert cell(model, "GPU Load", 0) == "1 / 4"
+    assert cell_kwargs(model, "CPU Load", 0)["fill_percent"] == 25
+    assert cell_kwargs(model, "GPU Load", 0)["fill_percent"] == 25
+    # nodes without allocation info show an empty load bar
+    assert cell(model, "CPU Load", 1) == "n / a"
+    assert cell_kwargs(model, "GPU Load", 1)["fill_percent"] == 0
+
+
+def render_with_rich(tree):
+    # the trees used to be printed with rich, the new builders must draw the same
+    buffer = StringIO()
+    Console(file=buffer, width=500).print(tree)
+    return [line.rstrip() for line in buffer.getvalue().splitlines()]
+
+
+ASSOCIATION_TREE = [
+    "root",
+    " root:admin",
+    " teaching",
+    "  teaching:alice",
+    "  students",
+    "   students:bob",
+    "   students:carol",
+    " research",
+    "  vision",
+    "  research:dave",
+]
+
+
+def test_account_tree_matches_rich(associations):
+    root, *_ = associations(ASSOCIATION_TREE)
+
+    def add_to_tree(tree, association):
+        label = (
+            association.user if isinstance(association, User) else association.account
+        )
+        node = tree.add(label)
+        for child in association.children:
+            add_to_tree(node, child)
+
+    tree = Tree("All Associations", hide_root=True)
+    add_to_tree(tree, root)
+    assert build_account_tree(root) == render_with_rich(tree)
+
+
+def test_job_tree_matches_rich():
+    jobs = [
+        SimpleNamespace(username=username, job_id_with_array=job_id)
+        for username, job_id in [
+            ("alice", "10"),
+            ("alice", "11[1]"),
+            ("alice", "11[2]"),
+            ("bob", "12"),
+            ("carol", "13"),
+            ("carol", "14"),
+        ]
+    ]
+
+    tree = Tree("All Jobs", hide_root=True)
+    for username, group in groupby(jobs, key=attrgetter("username")):
+        node = tree.add(username)
+        for job in group:
+            node.add(job.job_id_with_array)
+
+    tree_lines, joblist = build_job_tree(jobs, "username")
+    assert tree_lines == render_with_rich(tree)
+    # every group line has no job, the lines below it show the jobs in order
+    assert joblist == [None, *jobs[:3], None, jobs[3], None, *jobs[4:]]
+
+
+def test_lowest_grp_tres(associations):
+    tree = associations(
+        [
+            "root",
+            " limited=cpu=8",
+            "  nested=cpu=16",
+            "   nested:alice",
+            "  tight=cpu=2",
+            "   tight:bob=cpu=4",
+            " unlimited",
+            "  unlimited:carol",
+        ]
+    )
+    by_name = {
+        association.user or association.account: association for association in tree
+    }
+    bottlenecks = find_associations_with_lowest_grp_tres(tree, "max_cpus")
+
+    expected = {
+        "root": "root",
+        "limited": "limited",
+        "nested": "limited",
+        "alice": "limited",
+        "tight": "tight",
+        "bob": "tight",
+        "unlimited": "unlimited",
+        "carol": "carol",
+    }
+    for name, bottleneck in expected.items():
+        assert bottlenecks[id(by_name[name])] is by_name[bottleneck], name
+    # the single pass gives the same results as walking up from every association
+    for association in tree:
+        assert bottlenecks[id(association)] is get_association_with_lowest_grp_tres(
+            association, "max_cpus"
+        )
@@ -0,0 +1,26 @@
+import asyncio
+
+from dlmanage.slurmbridge import Account
+
+
+def test_create_leaves_write_only_values_out_of_the_query(monkeypatch, associations):
+    writes = []
+    queries = []
+
+    async def write(verb, new_values, filters):
+        writes.append((verb, new_values, filters))
+        return [""]
+
+    async def get(**filters):
+        queries.append(filters)
+        return associations([filters["account"]])[0]
+
+    monkeypatch.setattr(Account, "_scattmgr_write", write)
+    monkeypatch.setattr(Account, "get", get)
+
+    account = asyncio.run(Account.create(account="students", parent="teaching"))
+
+    assert account.account == "students"
+    # the parent is set when creating, but sacctmgr can't filter on it
+    assert writes == [("create", {"account": "students", "parent": "teaching"}, {})]
+    assert queries == [{"account": "students"}]